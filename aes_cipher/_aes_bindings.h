@@ -0,0 +1,208 @@
+/*
+ * Python bindings shared by _aesni.c and _aesarm.c.
+ *
+ * Include this after the backend's AES code. The including file defines:
+ *   AES_VEC                  the 128-bit vector type holding one round key
+ *   AES_LOAD(p), AES_STORE(p, v)
+ *                            unaligned 16-byte load/store of an AES_VEC
+ * and the functions
+ *   aes128_key_expansion, aes128_dec_key_schedule,
+ *   ecb_encrypt_core, ecb_decrypt_core, cfb_encrypt_core, cfb_decrypt_core,
+ *   pkcs7_pad_len
+ * with the signatures used below. AES_BINDINGS_METHODS expands to the
+ * PyMethodDef entries common to both modules.
+ */
+
+#ifndef AES_BINDINGS_H
+#define AES_BINDINGS_H
+
+static int
+check_len(const char *what, Py_ssize_t got, Py_ssize_t want)
+{
+    if (got != want) {
+        PyErr_Format(PyExc_ValueError, "%s must be exactly %zd bytes.", what, want);
+        return -1;
+    }
+    return 0;
+}
+
+#define AES128_SCHEDULE_BYTES ((AES128_ROUNDS + 1) * AES_BLOCK)
+
+/* Round keys travel to and from Python as their FIPS-197 byte serialization. */
+static void
+load_key_schedule(const uint8_t *sched, AES_VEC rk[AES128_ROUNDS + 1])
+{
+    for (int r = 0; r <= AES128_ROUNDS; r++)
+        rk[r] = AES_LOAD(sched + r * AES_BLOCK);
+}
+
+static PyObject *
+py_expand_key(PyObject *self, PyObject *args)
+{
+    Py_buffer key;
+    PyObject *result = NULL;
+    AES_VEC rk[AES128_ROUNDS + 1];
+
+    if (!PyArg_ParseTuple(args, "y*", &key))
+        return NULL;
+    if (check_len("AES-128 key", key.len, AES_BLOCK) == 0) {
+        result = PyBytes_FromStringAndSize(NULL, AES128_SCHEDULE_BYTES);
+        if (result != NULL) {
+            uint8_t *out = (uint8_t *)PyBytes_AS_STRING(result);
+            aes128_key_expansion((const uint8_t *)key.buf, rk);
+            for (int r = 0; r <= AES128_ROUNDS; r++)
+                AES_STORE(out + r * AES_BLOCK, rk[r]);
+        }
+    }
+    PyBuffer_Release(&key);
+    return result;
+}
+
+/*
+ * Buffers are acquired with PyArg_ParseTuple before the GIL is dropped and
+ * released after it is re-taken. As in hashlib, small inputs keep the GIL
+ * because the hand-off would cost more than the work.
+ */
+#define GIL_MINSIZE 2048
+
+/* dst must match src in length and may only alias it exactly when allow_alias is set. */
+static int
+check_dst(const Py_buffer *src, const Py_buffer *dst, int allow_alias)
+{
+    const char *s = (const char *)src->buf, *d = (const char *)dst->buf;
+
+    if (dst->len != src->len) {
+        PyErr_SetString(PyExc_ValueError, "Output buffer must be the same length as the input.");
+        return -1;
+    }
+    if (src->len && !(allow_alias && s == d) && s < d + dst->len && d < s + src->len) {
+        PyErr_SetString(PyExc_ValueError, "Output buffer must not overlap the input.");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+py_ecb(PyObject *args, int decrypt)
+{
+    Py_buffer sched, src, dst;
+    PyObject *result = NULL;
+    AES_VEC rk[AES128_ROUNDS + 1], dk[AES128_ROUNDS + 1];
+
+    if (!PyArg_ParseTuple(args, "y*y*w*", &sched, &src, &dst))
+        return NULL;
+    if (check_len("AES-128 key schedule", sched.len, AES128_SCHEDULE_BYTES) < 0
+        || check_dst(&src, &dst, 1) < 0)
+        goto done;
+    if (src.len % AES_BLOCK != 0) {
+        PyErr_SetString(PyExc_ValueError, "Data length must be a multiple of block size.");
+        goto done;
+    }
+
+    load_key_schedule((const uint8_t *)sched.buf, rk);
+    PyThreadState *ts = src.len >= GIL_MINSIZE ? PyEval_SaveThread() : NULL;
+    if (decrypt) {
+        aes128_dec_key_schedule(rk, dk);
+        ecb_decrypt_core((const uint8_t *)src.buf, (uint8_t *)dst.buf, (size_t)src.len / AES_BLOCK, dk);
+    }
+    else {
+        ecb_encrypt_core((const uint8_t *)src.buf, (uint8_t *)dst.buf, (size_t)src.len / AES_BLOCK, rk);
+    }
+    if (ts != NULL)
+        PyEval_RestoreThread(ts);
+    result = Py_NewRef(Py_None);
+
+done:
+    PyBuffer_Release(&sched);
+    PyBuffer_Release(&src);
+    PyBuffer_Release(&dst);
+    return result;
+}
+
+static PyObject *
+py_cfb(PyObject *args, int decrypt)
+{
+    Py_buffer sched, iv, src, dst;
+    PyObject *result = NULL;
+    AES_VEC rk[AES128_ROUNDS + 1];
+
+    if (!PyArg_ParseTuple(args, "y*y*y*w*", &sched, &iv, &src, &dst))
+        return NULL;
+    if (check_len("AES-128 key schedule", sched.len, AES128_SCHEDULE_BYTES) < 0
+        || check_len("IV", iv.len, AES_BLOCK) < 0 || check_dst(&src, &dst, 0) < 0)
+        goto done;
+
+    load_key_schedule((const uint8_t *)sched.buf, rk);
+    /* CFB encrypt is serial across blocks, but it still runs entirely in C. */
+    PyThreadState *ts = src.len >= GIL_MINSIZE ? PyEval_SaveThread() : NULL;
+    if (decrypt)
+        cfb_decrypt_core((const uint8_t *)src.buf, (uint8_t *)dst.buf, (size_t)src.len, (const uint8_t *)iv.buf, rk);
+    else
+        cfb_encrypt_core((const uint8_t *)src.buf, (uint8_t *)dst.buf, (size_t)src.len, (const uint8_t *)iv.buf, rk);
+    if (ts != NULL)
+        PyEval_RestoreThread(ts);
+    result = Py_NewRef(Py_None);
+
+done:
+    PyBuffer_Release(&sched);
+    PyBuffer_Release(&iv);
+    PyBuffer_Release(&src);
+    PyBuffer_Release(&dst);
+    return result;
+}
+
+static PyObject *
+py_ecb_encrypt(PyObject *self, PyObject *args)
+{
+    return py_ecb(args, 0);
+}
+
+static PyObject *
+py_ecb_decrypt(PyObject *self, PyObject *args)
+{
+    return py_ecb(args, 1);
+}
+
+static PyObject *
+py_cfb_encrypt(PyObject *self, PyObject *args)
+{
+    return py_cfb(args, 0);
+}
+
+static PyObject *
+py_cfb_decrypt(PyObject *self, PyObject *args)
+{
+    return py_cfb(args, 1);
+}
+
+static PyObject *
+py_pkcs7_unpad_len(PyObject *self, PyObject *args)
+{
+    Py_buffer data;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*", &data))
+        return NULL;
+    if (data.len == 0 || data.len % AES_BLOCK != 0)
+        PyErr_SetString(PyExc_ValueError, "Invalid padded data length.");
+    else
+        result = PyLong_FromLong(pkcs7_pad_len((const uint8_t *)data.buf + data.len - AES_BLOCK));
+    PyBuffer_Release(&data);
+    return result;
+}
+
+#define AES_BINDINGS_METHODS \
+    {"expand_key", py_expand_key, METH_VARARGS, \
+     "expand_key(key16) -> bytes: the 176-byte AES-128 key schedule used by the functions below."}, \
+    {"aes128_ecb_encrypt", py_ecb_encrypt, METH_VARARGS, \
+     "aes128_ecb_encrypt(sched, src, dst): encrypt block-aligned src into dst."}, \
+    {"aes128_ecb_decrypt", py_ecb_decrypt, METH_VARARGS, \
+     "aes128_ecb_decrypt(sched, src, dst): decrypt block-aligned src into dst."}, \
+    {"aes128_cfb_encrypt", py_cfb_encrypt, METH_VARARGS, \
+     "aes128_cfb_encrypt(sched, iv16, src, dst): CFB-128 encrypt src (any length) into dst."}, \
+    {"aes128_cfb_decrypt", py_cfb_decrypt, METH_VARARGS, \
+     "aes128_cfb_decrypt(sched, iv16, src, dst): CFB-128 decrypt src (any length) into dst."}, \
+    {"pkcs7_unpad_len", py_pkcs7_unpad_len, METH_VARARGS, \
+     "pkcs7_unpad_len(data) -> PKCS#7 pad length of the last block, or 0 if invalid."}
+
+#endif /* AES_BINDINGS_H */
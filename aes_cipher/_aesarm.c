@@ -0,0 +1,203 @@
+/*
+ * AES-128 ECB/CFB using the ARMv8 Cryptography Extensions.
+ *
+ * Built as the optional extension aes_cipher._aesarm (see setup.py) and
+ * exposes the same functions as _aesni. cipher.py only calls into it on
+ * AArch64 hosts that advertise the "aes" feature.
+ *
+ * AESE performs AddRoundKey *before* SubBytes/ShiftRows, so compared with the
+ * x86 schedule every round key is applied one step earlier and the final
+ * round key is a plain XOR.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#if !defined(__ARM_FEATURE_CRYPTO) && !defined(__ARM_FEATURE_AES)
+#error "_aesarm must be compiled with -march=armv8-a+crypto"
+#endif
+
+#include <arm_neon.h>
+
+#define AES_BLOCK 16
+#define AES128_ROUNDS 10
+
+/* ARM has no key-generation instruction, so the schedule is built in software. */
+static const uint8_t SBOX[256] = {
+    0x63, 0x7C, 0x77, 0x7B, 0xF2, 0x6B, 0x6F, 0xC5, 0x30, 0x01, 0x67, 0x2B, 0xFE, 0xD7, 0xAB, 0x76,
+    0xCA, 0x82, 0xC9, 0x7D, 0xFA, 0x59, 0x47, 0xF0, 0xAD, 0xD4, 0xA2, 0xAF, 0x9C, 0xA4, 0x72, 0xC0,
+    0xB7, 0xFD, 0x93, 0x26, 0x36, 0x3F, 0xF7, 0xCC, 0x34, 0xA5, 0xE5, 0xF1, 0x71, 0xD8, 0x31, 0x15,
+    0x04, 0xC7, 0x23, 0xC3, 0x18, 0x96, 0x05, 0x9A, 0x07, 0x12, 0x80, 0xE2, 0xEB, 0x27, 0xB2, 0x75,
+    0x09, 0x83, 0x2C, 0x1A, 0x1B, 0x6E, 0x5A, 0xA0, 0x52, 0x3B, 0xD6, 0xB3, 0x29, 0xE3, 0x2F, 0x84,
+    0x53, 0xD1, 0x00, 0xED, 0x20, 0xFC, 0xB1, 0x5B, 0x6A, 0xCB, 0xBE, 0x39, 0x4A, 0x4C, 0x58, 0xCF,
+    0xD0, 0xEF, 0xAA, 0xFB, 0x43, 0x4D, 0x33, 0x85, 0x45, 0xF9, 0x02, 0x7F, 0x50, 0x3C, 0x9F, 0xA8,
+    0x51, 0xA3, 0x40, 0x8F, 0x92, 0x9D, 0x38, 0xF5, 0xBC, 0xB6, 0xDA, 0x21, 0x10, 0xFF, 0xF3, 0xD2,
+    0xCD, 0x0C, 0x13, 0xEC, 0x5F, 0x97, 0x44, 0x17, 0xC4, 0xA7, 0x7E, 0x3D, 0x64, 0x5D, 0x19, 0x73,
+    0x60, 0x81, 0x4F, 0xDC, 0x22, 0x2A, 0x90, 0x88, 0x46, 0xEE, 0xB8, 0x14, 0xDE, 0x5E, 0x0B, 0xDB,
+    0xE0, 0x32, 0x3A, 0x0A, 0x49, 0x06, 0x24, 0x5C, 0xC2, 0xD3, 0xAC, 0x62, 0x91, 0x95, 0xE4, 0x79,
+    0xE7, 0xC8, 0x37, 0x6D, 0x8D, 0xD5, 0x4E, 0xA9, 0x6C, 0x56, 0xF4, 0xEA, 0x65, 0x7A, 0xAE, 0x08,
+    0xBA, 0x78, 0x25, 0x2E, 0x1C, 0xA6, 0xB4, 0xC6, 0xE8, 0xDD, 0x74, 0x1F, 0x4B, 0xBD, 0x8B, 0x8A,
+    0x70, 0x3E, 0xB5, 0x66, 0x48, 0x03, 0xF6, 0x0E, 0x61, 0x35, 0x57, 0xB9, 0x86, 0xC1, 0x1D, 0x9E,
+    0xE1, 0xF8, 0x98, 0x11, 0x69, 0xD9, 0x8E, 0x94, 0x9B, 0x1E, 0x87, 0xE9, 0xCE, 0x55, 0x28, 0xDF,
+    0x8C, 0xA1, 0x89, 0x0D, 0xBF, 0xE6, 0x42, 0x68, 0x41, 0x99, 0x2D, 0x0F, 0xB0, 0x54, 0xBB, 0x16,
+};
+
+static const uint8_t RCON[AES128_ROUNDS + 1] = {
+    0x00, 0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36,
+};
+
+/* FIPS-197 5.2 key expansion, byte-wise. */
+static void
+aes128_key_expansion(const uint8_t *key, uint8x16_t rk[AES128_ROUNDS + 1])
+{
+    uint8_t w[(AES128_ROUNDS + 1) * AES_BLOCK];
+
+    memcpy(w, key, AES_BLOCK);
+    for (int i = 4; i < 4 * (AES128_ROUNDS + 1); i++) {
+        uint8_t t[4];
+        memcpy(t, w + 4 * (i - 1), 4);
+        if (i % 4 == 0) {
+            uint8_t t0 = t[0];
+            t[0] = SBOX[t[1]] ^ RCON[i / 4];
+            t[1] = SBOX[t[2]];
+            t[2] = SBOX[t[3]];
+            t[3] = SBOX[t0];
+        }
+        for (int j = 0; j < 4; j++)
+            w[4 * i + j] = w[4 * (i - 4) + j] ^ t[j];
+    }
+    for (int r = 0; r <= AES128_ROUNDS; r++)
+        rk[r] = vld1q_u8(w + r * AES_BLOCK);
+}
+
+/* Equivalent inverse cipher schedule (FIPS-197 5.3.5). */
+static void
+aes128_dec_key_schedule(const uint8x16_t rk[AES128_ROUNDS + 1], uint8x16_t dk[AES128_ROUNDS + 1])
+{
+    dk[0] = rk[AES128_ROUNDS];
+    for (int i = 1; i < AES128_ROUNDS; i++)
+        dk[i] = vaesimcq_u8(rk[AES128_ROUNDS - i]);
+    dk[AES128_ROUNDS] = rk[0];
+}
+
+static inline uint8x16_t
+aes128_encrypt_neon(uint8x16_t state, const uint8x16_t rk[AES128_ROUNDS + 1])
+{
+    for (int r = 0; r < AES128_ROUNDS - 1; r++)
+        state = vaesmcq_u8(vaeseq_u8(state, rk[r]));
+    state = vaeseq_u8(state, rk[AES128_ROUNDS - 1]);
+    return veorq_u8(state, rk[AES128_ROUNDS]);
+}
+
+static inline uint8x16_t
+aes128_decrypt_neon(uint8x16_t state, const uint8x16_t dk[AES128_ROUNDS + 1])
+{
+    for (int r = 0; r < AES128_ROUNDS - 1; r++)
+        state = vaesimcq_u8(vaesdq_u8(state, dk[r]));
+    state = vaesdq_u8(state, dk[AES128_ROUNDS - 1]);
+    return veorq_u8(state, dk[AES128_ROUNDS]);
+}
+
+static void
+ecb_encrypt_core(const uint8_t *in, uint8_t *out, size_t nblocks, const uint8x16_t rk[AES128_ROUNDS + 1])
+{
+    for (size_t i = 0; i < nblocks; i++)
+        vst1q_u8(out + i * AES_BLOCK, aes128_encrypt_neon(vld1q_u8(in + i * AES_BLOCK), rk));
+}
+
+static void
+ecb_decrypt_core(const uint8_t *in, uint8_t *out, size_t nblocks, const uint8x16_t dk[AES128_ROUNDS + 1])
+{
+    for (size_t i = 0; i < nblocks; i++)
+        vst1q_u8(out + i * AES_BLOCK, aes128_decrypt_neon(vld1q_u8(in + i * AES_BLOCK), dk));
+}
+
+/* XOR a partial trailing block (len < 16) against one keystream block. */
+static void
+cfb_xor_tail(const uint8_t *in, uint8_t *out, size_t len, uint8x16_t keystream)
+{
+    uint8_t buf[AES_BLOCK] = {0};
+    memcpy(buf, in, len);
+    vst1q_u8(buf, veorq_u8(vld1q_u8(buf), keystream));
+    memcpy(out, buf, len);
+}
+
+/*
+ * C_i = E(C_{i-1}) ^ P_i is inherently serial, so the feedback block is kept
+ * in a register between iterations instead of being reloaded from out.
+ */
+static void
+cfb_encrypt_core(const uint8_t *in, uint8_t *out, size_t len, const uint8_t *iv,
+                 const uint8x16_t rk[AES128_ROUNDS + 1])
+{
+    uint8x16_t fb = vld1q_u8(iv);
+    size_t full = len - (len % AES_BLOCK);
+    for (size_t i = 0; i < full; i += AES_BLOCK) {
+        fb = veorq_u8(aes128_encrypt_neon(fb, rk), vld1q_u8(in + i));
+        vst1q_u8(out + i, fb);
+    }
+    if (len > full)
+        cfb_xor_tail(in + full, out + full, len - full, aes128_encrypt_neon(fb, rk));
+}
+
+static void
+cfb_decrypt_core(const uint8_t *in, uint8_t *out, size_t len, const uint8_t *iv,
+                 const uint8x16_t rk[AES128_ROUNDS + 1])
+{
+    const uint8_t *prev = iv;
+    size_t full = len - (len % AES_BLOCK);
+    for (size_t i = 0; i < full; i += AES_BLOCK) {
+        uint8x16_t ks = aes128_encrypt_neon(vld1q_u8(prev), rk);
+        vst1q_u8(out + i, veorq_u8(ks, vld1q_u8(in + i)));
+        prev = in + i;
+    }
+    if (len > full)
+        cfb_xor_tail(in + full, out + full, len - full, aes128_encrypt_neon(vld1q_u8(prev), rk));
+}
+
+/*
+ * PKCS#7 check of the final block without branches on its contents: returns
+ * the pad length if valid, 0 otherwise.
+ */
+static int
+pkcs7_pad_len(const uint8_t *last)
+{
+    static const uint8_t dist_from_end[AES_BLOCK] = {
+        16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1,
+    };
+    uint8_t pl = last[AES_BLOCK - 1];
+    uint8x16_t pad = vdupq_n_u8(pl);
+    uint8x16_t in_pad = vcleq_u8(vld1q_u8(dist_from_end), pad);
+    uint8x16_t mismatch = vbicq_u8(in_pad, vceqq_u8(vld1q_u8(last), pad));
+    unsigned bad = vmaxvq_u8(mismatch) | ((unsigned)(pl - 1) >> 4);
+    return (int)pl & -(int)(bad == 0);
+}
+
+/* ---------------------------------------------------------------------------
+ * Python bindings
+ * ------------------------------------------------------------------------- */
+
+#define AES_VEC uint8x16_t
+#define AES_LOAD(p) vld1q_u8(p)
+#define AES_STORE(p, v) vst1q_u8((p), (v))
+#include "_aes_bindings.h"
+
+static PyMethodDef aesarm_methods[] = {
+    AES_BINDINGS_METHODS,
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef aesarm_module = {
+    PyModuleDef_HEAD_INIT,
+    "_aesarm",
+    "AES-128 ECB/CFB backed by the ARMv8 Cryptography Extensions.",
+    -1,
+    aesarm_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__aesarm(void)
+{
+    return PyModule_Create(&aesarm_module);
+}
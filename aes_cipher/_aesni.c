@@ -0,0 +1,545 @@
+/*
+ * AES-128 ECB/CFB using the x86 AES-NI instructions.
+ *
+ * Built as the optional extension aes_cipher._aesni (see setup.py).
+ * cipher.py only calls into it when has_aesni() reports CPU support and
+ * falls back to the pure-Python implementation otherwise.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+#if !defined(__AES__)
+#error "_aesni must be compiled with -maes -msse4.1"
+#endif
+
+#include <wmmintrin.h>
+#include <smmintrin.h>
+
+/*
+ * The VAES path is compiled per-function via target attributes so the rest of
+ * the module still runs on CPUs with plain AES-NI; it is selected at import.
+ */
+#if defined(__GNUC__) && (defined(__clang__) || __GNUC__ >= 8)
+#define HAVE_VAES_BUILD 1
+#include <immintrin.h>
+#define VAES_TARGET __attribute__((target("vaes,avx512f,avx512bw")))
+#else
+#define HAVE_VAES_BUILD 0
+#endif
+
+#define AES_BLOCK 16
+#define AES128_ROUNDS 10
+
+/* One step of the AES-128 key schedule (FIPS-197 5.2) on a whole round key. */
+static __m128i
+aes128_expand_step(__m128i key, __m128i keygened)
+{
+    keygened = _mm_shuffle_epi32(keygened, _MM_SHUFFLE(3, 3, 3, 3));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    return _mm_xor_si128(key, keygened);
+}
+
+/* aeskeygenassist needs an immediate rcon, hence the macro. */
+#define KEY_EXPANSION_128(rk, i, rcon) \
+    (rk)[i] = aes128_expand_step((rk)[(i) - 1], _mm_aeskeygenassist_si128((rk)[(i) - 1], (rcon)))
+
+static void
+aes128_key_expansion(const uint8_t *key, __m128i rk[AES128_ROUNDS + 1])
+{
+    rk[0] = _mm_loadu_si128((const __m128i *)key);
+    KEY_EXPANSION_128(rk, 1, 0x01);
+    KEY_EXPANSION_128(rk, 2, 0x02);
+    KEY_EXPANSION_128(rk, 3, 0x04);
+    KEY_EXPANSION_128(rk, 4, 0x08);
+    KEY_EXPANSION_128(rk, 5, 0x10);
+    KEY_EXPANSION_128(rk, 6, 0x20);
+    KEY_EXPANSION_128(rk, 7, 0x40);
+    KEY_EXPANSION_128(rk, 8, 0x80);
+    KEY_EXPANSION_128(rk, 9, 0x1B);
+    KEY_EXPANSION_128(rk, 10, 0x36);
+}
+
+/* Decryption schedule in the "equivalent inverse cipher" form (FIPS-197 5.3.5). */
+static void
+aes128_dec_key_schedule(const __m128i rk[AES128_ROUNDS + 1], __m128i dk[AES128_ROUNDS + 1])
+{
+    dk[0] = rk[AES128_ROUNDS];
+    for (int i = 1; i < AES128_ROUNDS; i++)
+        dk[i] = _mm_aesimc_si128(rk[AES128_ROUNDS - i]);
+    dk[AES128_ROUNDS] = rk[0];
+}
+
+static inline __m128i
+aes128_encrypt_xmm(__m128i state, const __m128i rk[AES128_ROUNDS + 1])
+{
+    state = _mm_xor_si128(state, rk[0]);
+    for (int r = 1; r < AES128_ROUNDS; r++)
+        state = _mm_aesenc_si128(state, rk[r]);
+    return _mm_aesenclast_si128(state, rk[AES128_ROUNDS]);
+}
+
+static inline __m128i
+aes128_decrypt_xmm(__m128i state, const __m128i dk[AES128_ROUNDS + 1])
+{
+    state = _mm_xor_si128(state, dk[0]);
+    for (int r = 1; r < AES128_ROUNDS; r++)
+        state = _mm_aesdec_si128(state, dk[r]);
+    return _mm_aesdeclast_si128(state, dk[AES128_ROUNDS]);
+}
+
+/*
+ * aesenc has a latency of several cycles but a throughput of one per cycle,
+ * so independent blocks are processed eight at a time to keep the AES unit
+ * busy. The single-block loops handle the remaining tail.
+ */
+#define PIPE 8
+
+#define LOAD8(s, p)                                            \
+    do {                                                       \
+        for (int b_ = 0; b_ < PIPE; b_++)                      \
+            (s)[b_] = _mm_loadu_si128((const __m128i *)((p) + b_ * AES_BLOCK)); \
+    } while (0)
+
+#define ROUND8(s, op, k)                                       \
+    do {                                                       \
+        (s)[0] = op((s)[0], (k)); (s)[1] = op((s)[1], (k));    \
+        (s)[2] = op((s)[2], (k)); (s)[3] = op((s)[3], (k));    \
+        (s)[4] = op((s)[4], (k)); (s)[5] = op((s)[5], (k));    \
+        (s)[6] = op((s)[6], (k)); (s)[7] = op((s)[7], (k));    \
+    } while (0)
+
+static inline void
+aes128_encrypt8(__m128i s[PIPE], const __m128i rk[AES128_ROUNDS + 1])
+{
+    ROUND8(s, _mm_xor_si128, rk[0]);
+    for (int r = 1; r < AES128_ROUNDS; r++)
+        ROUND8(s, _mm_aesenc_si128, rk[r]);
+    ROUND8(s, _mm_aesenclast_si128, rk[AES128_ROUNDS]);
+}
+
+static inline void
+aes128_decrypt8(__m128i s[PIPE], const __m128i dk[AES128_ROUNDS + 1])
+{
+    ROUND8(s, _mm_xor_si128, dk[0]);
+    for (int r = 1; r < AES128_ROUNDS; r++)
+        ROUND8(s, _mm_aesdec_si128, dk[r]);
+    ROUND8(s, _mm_aesdeclast_si128, dk[AES128_ROUNDS]);
+}
+
+#if HAVE_VAES_BUILD
+/* 16 blocks per iteration: four ZMM registers of four blocks each. */
+#define VAES_BLOCKS 16
+
+#define ROUND4Z(z, op, k)                                      \
+    do {                                                       \
+        (z)[0] = op((z)[0], (k)); (z)[1] = op((z)[1], (k));    \
+        (z)[2] = op((z)[2], (k)); (z)[3] = op((z)[3], (k));    \
+    } while (0)
+
+VAES_TARGET static void
+vaes_broadcast_keys(const __m128i k[AES128_ROUNDS + 1], __m512i kb[AES128_ROUNDS + 1])
+{
+    for (int r = 0; r <= AES128_ROUNDS; r++)
+        kb[r] = _mm512_broadcast_i32x4(k[r]);
+}
+
+VAES_TARGET static inline void
+vaes_encrypt16(__m512i z[4], const __m512i rkb[AES128_ROUNDS + 1])
+{
+    ROUND4Z(z, _mm512_xor_si512, rkb[0]);
+    for (int r = 1; r < AES128_ROUNDS; r++)
+        ROUND4Z(z, _mm512_aesenc_epi128, rkb[r]);
+    ROUND4Z(z, _mm512_aesenclast_epi128, rkb[AES128_ROUNDS]);
+}
+
+/* Returns the number of blocks processed (a multiple of VAES_BLOCKS). */
+VAES_TARGET static size_t
+ecb_crypt_vaes(const uint8_t *in, uint8_t *out, size_t nblocks,
+               const __m128i k[AES128_ROUNDS + 1], int decrypt)
+{
+    __m512i kb[AES128_ROUNDS + 1], z[4];
+    size_t done = 0;
+
+    vaes_broadcast_keys(k, kb);
+    for (; nblocks - done >= VAES_BLOCKS; done += VAES_BLOCKS) {
+        const uint8_t *src = in + done * AES_BLOCK;
+        for (int b = 0; b < 4; b++)
+            z[b] = _mm512_loadu_si512((const void *)(src + b * 64));
+        if (decrypt) {
+            ROUND4Z(z, _mm512_xor_si512, kb[0]);
+            for (int r = 1; r < AES128_ROUNDS; r++)
+                ROUND4Z(z, _mm512_aesdec_epi128, kb[r]);
+            ROUND4Z(z, _mm512_aesdeclast_epi128, kb[AES128_ROUNDS]);
+        }
+        else {
+            vaes_encrypt16(z, kb);
+        }
+        for (int b = 0; b < 4; b++)
+            _mm512_storeu_si512((void *)(out + done * AES_BLOCK + b * 64), z[b]);
+    }
+    return done;
+}
+
+/* out[j] = E(fb[j]) ^ in[j]; returns the number of blocks processed. */
+VAES_TARGET static size_t
+keystream_xor_vaes(const uint8_t *fb, const uint8_t *in, uint8_t *out, size_t nblocks,
+                   const __m128i rk[AES128_ROUNDS + 1])
+{
+    __m512i kb[AES128_ROUNDS + 1], z[4];
+    size_t done = 0;
+
+    vaes_broadcast_keys(rk, kb);
+    for (; nblocks - done >= VAES_BLOCKS; done += VAES_BLOCKS) {
+        size_t off = done * AES_BLOCK;
+        for (int b = 0; b < 4; b++)
+            z[b] = _mm512_loadu_si512((const void *)(fb + off + b * 64));
+        vaes_encrypt16(z, kb);
+        for (int b = 0; b < 4; b++) {
+            __m512i c = _mm512_loadu_si512((const void *)(in + off + b * 64));
+            _mm512_storeu_si512((void *)(out + off + b * 64), _mm512_xor_si512(z[b], c));
+        }
+    }
+    return done;
+}
+#endif /* HAVE_VAES_BUILD */
+
+/*
+ * Set at import when the CPU has VAES/AVX-512. The dispatchers below only take the
+ * VAES path for at least VAES_BLOCKS blocks, so short inputs never touch ZMM state.
+ */
+static int use_vaes = 0;
+
+static void
+ecb_encrypt_core(const uint8_t *in, uint8_t *out, size_t nblocks, const __m128i rk[AES128_ROUNDS + 1])
+{
+    __m128i s[PIPE];
+#if HAVE_VAES_BUILD
+    if (use_vaes && nblocks >= VAES_BLOCKS) {
+        size_t done = ecb_crypt_vaes(in, out, nblocks, rk, 0);
+        in += done * AES_BLOCK;
+        out += done * AES_BLOCK;
+        nblocks -= done;
+    }
+#endif
+    for (; nblocks >= PIPE; nblocks -= PIPE, in += PIPE * AES_BLOCK, out += PIPE * AES_BLOCK) {
+        LOAD8(s, in);
+        aes128_encrypt8(s, rk);
+        for (int b = 0; b < PIPE; b++)
+            _mm_storeu_si128((__m128i *)(out + b * AES_BLOCK), s[b]);
+    }
+    for (size_t i = 0; i < nblocks; i++) {
+        __m128i t = _mm_loadu_si128((const __m128i *)(in + i * AES_BLOCK));
+        _mm_storeu_si128((__m128i *)(out + i * AES_BLOCK), aes128_encrypt_xmm(t, rk));
+    }
+}
+
+static void
+ecb_decrypt_core(const uint8_t *in, uint8_t *out, size_t nblocks, const __m128i dk[AES128_ROUNDS + 1])
+{
+    __m128i s[PIPE];
+#if HAVE_VAES_BUILD
+    if (use_vaes && nblocks >= VAES_BLOCKS) {
+        size_t done = ecb_crypt_vaes(in, out, nblocks, dk, 1);
+        in += done * AES_BLOCK;
+        out += done * AES_BLOCK;
+        nblocks -= done;
+    }
+#endif
+    for (; nblocks >= PIPE; nblocks -= PIPE, in += PIPE * AES_BLOCK, out += PIPE * AES_BLOCK) {
+        LOAD8(s, in);
+        aes128_decrypt8(s, dk);
+        for (int b = 0; b < PIPE; b++)
+            _mm_storeu_si128((__m128i *)(out + b * AES_BLOCK), s[b]);
+    }
+    for (size_t i = 0; i < nblocks; i++) {
+        __m128i t = _mm_loadu_si128((const __m128i *)(in + i * AES_BLOCK));
+        _mm_storeu_si128((__m128i *)(out + i * AES_BLOCK), aes128_decrypt_xmm(t, dk));
+    }
+}
+
+/* XOR a partial trailing block (len < 16) against one keystream block. */
+static void
+cfb_xor_tail(const uint8_t *in, uint8_t *out, size_t len, __m128i keystream)
+{
+    uint8_t buf[AES_BLOCK] = {0};
+    memcpy(buf, in, len);
+    _mm_storeu_si128((__m128i *)buf, _mm_xor_si128(_mm_loadu_si128((const __m128i *)buf), keystream));
+    memcpy(out, buf, len);
+}
+
+/*
+ * C_i = E(C_{i-1}) ^ P_i is inherently serial, so the feedback block is kept
+ * in a register between iterations instead of being reloaded from out.
+ */
+static void
+cfb_encrypt_core(const uint8_t *in, uint8_t *out, size_t len, const uint8_t *iv,
+                 const __m128i rk[AES128_ROUNDS + 1])
+{
+    __m128i fb = _mm_loadu_si128((const __m128i *)iv);
+    size_t full = len - (len % AES_BLOCK);
+    for (size_t i = 0; i < full; i += AES_BLOCK) {
+        fb = _mm_xor_si128(aes128_encrypt_xmm(fb, rk), _mm_loadu_si128((const __m128i *)(in + i)));
+        _mm_storeu_si128((__m128i *)(out + i), fb);
+    }
+    if (len > full)
+        cfb_xor_tail(in + full, out + full, len - full, aes128_encrypt_xmm(fb, rk));
+}
+
+/* out[j] = E(fb[j]) ^ in[j] for nblocks blocks with contiguous feedback fb. */
+static void
+keystream_xor_core(const uint8_t *fb, const uint8_t *in, uint8_t *out, size_t nblocks,
+                   const __m128i rk[AES128_ROUNDS + 1])
+{
+    __m128i s[PIPE];
+#if HAVE_VAES_BUILD
+    if (use_vaes && nblocks >= VAES_BLOCKS) {
+        size_t done = keystream_xor_vaes(fb, in, out, nblocks, rk);
+        fb += done * AES_BLOCK;
+        in += done * AES_BLOCK;
+        out += done * AES_BLOCK;
+        nblocks -= done;
+    }
+#endif
+    for (; nblocks >= PIPE; nblocks -= PIPE) {
+        LOAD8(s, fb);
+        aes128_encrypt8(s, rk);
+        for (int b = 0; b < PIPE; b++) {
+            __m128i c = _mm_loadu_si128((const __m128i *)(in + b * AES_BLOCK));
+            _mm_storeu_si128((__m128i *)(out + b * AES_BLOCK), _mm_xor_si128(s[b], c));
+        }
+        fb += PIPE * AES_BLOCK;
+        in += PIPE * AES_BLOCK;
+        out += PIPE * AES_BLOCK;
+    }
+    for (size_t i = 0; i < nblocks; i++) {
+        __m128i ks = aes128_encrypt_xmm(_mm_loadu_si128((const __m128i *)(fb + i * AES_BLOCK)), rk);
+        __m128i c = _mm_loadu_si128((const __m128i *)(in + i * AES_BLOCK));
+        _mm_storeu_si128((__m128i *)(out + i * AES_BLOCK), _mm_xor_si128(ks, c));
+    }
+}
+
+/*
+ * P_i = E(C_{i-1}) ^ C_i: every keystream input is already known, so decrypt
+ * pipelines. Block 0 uses the IV; blocks 1.. feed back from the ciphertext itself.
+ */
+static void
+cfb_decrypt_core(const uint8_t *in, uint8_t *out, size_t len, const uint8_t *iv,
+                 const __m128i rk[AES128_ROUNDS + 1])
+{
+    size_t nfull = len / AES_BLOCK;
+    size_t full = nfull * AES_BLOCK;
+    const uint8_t *prev = iv;
+
+    if (nfull) {
+        keystream_xor_core(iv, in, out, 1, rk);
+        keystream_xor_core(in, in + AES_BLOCK, out + AES_BLOCK, nfull - 1, rk);
+        prev = in + full - AES_BLOCK;
+    }
+    if (len > full) {
+        __m128i ks = aes128_encrypt_xmm(_mm_loadu_si128((const __m128i *)prev), rk);
+        cfb_xor_tail(in + full, out + full, len - full, ks);
+    }
+}
+
+/*
+ * PKCS#7 check of the final block without branches on its contents: returns
+ * the pad length if valid, 0 otherwise.
+ */
+static int
+pkcs7_pad_len(const uint8_t *last)
+{
+    const __m128i dist_from_end = _mm_setr_epi8(16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1);
+    uint8_t pl = last[AES_BLOCK - 1];
+    __m128i pad = _mm_set1_epi8((char)pl);
+    /* dist <= pl (unsigned) selects the bytes that must equal pl */
+    __m128i in_pad = _mm_cmpeq_epi8(_mm_min_epu8(dist_from_end, pad), dist_from_end);
+    __m128i mismatch = _mm_andnot_si128(_mm_cmpeq_epi8(_mm_loadu_si128((const __m128i *)last), pad), in_pad);
+    unsigned bad = (unsigned)_mm_movemask_epi8(mismatch) | ((unsigned)(pl - 1) >> 4);
+    return (int)pl & -(int)(bad == 0);
+}
+
+/*
+ * Hex codec with SSSE3: pshufb maps 16 nibbles to ASCII (or validates and
+ * combines 32 digits) per step. Not AES, but it lives here because the CLI
+ * hex-encodes everything the cipher produces.
+ */
+static const char HEX_DIGITS[] = "0123456789abcdef";
+
+static void
+hex_encode_core(const uint8_t *in, size_t n, uint8_t *out)
+{
+    const __m128i lut = _mm_setr_epi8('0', '1', '2', '3', '4', '5', '6', '7',
+                                      '8', '9', 'a', 'b', 'c', 'd', 'e', 'f');
+    const __m128i low4 = _mm_set1_epi8(0x0F);
+    size_t i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m128i v = _mm_loadu_si128((const __m128i *)(in + i));
+        __m128i hi = _mm_shuffle_epi8(lut, _mm_and_si128(_mm_srli_epi16(v, 4), low4));
+        __m128i lo = _mm_shuffle_epi8(lut, _mm_and_si128(v, low4));
+        _mm_storeu_si128((__m128i *)(out + 2 * i), _mm_unpacklo_epi8(hi, lo));
+        _mm_storeu_si128((__m128i *)(out + 2 * i + 16), _mm_unpackhi_epi8(hi, lo));
+    }
+    for (; i < n; i++) {
+        out[2 * i] = HEX_DIGITS[in[i] >> 4];
+        out[2 * i + 1] = HEX_DIGITS[in[i] & 0x0F];
+    }
+}
+
+/* Nibble values of 16 ASCII hex digits; *ok is cleared if any byte is not [0-9a-fA-F]. */
+static inline __m128i
+hex_nibbles16(__m128i c, int *ok)
+{
+    __m128i lc = _mm_or_si128(c, _mm_set1_epi8(0x20));
+    __m128i is_digit = _mm_and_si128(_mm_cmpgt_epi8(c, _mm_set1_epi8('0' - 1)),
+                                     _mm_cmplt_epi8(c, _mm_set1_epi8('9' + 1)));
+    __m128i is_alpha = _mm_and_si128(_mm_cmpgt_epi8(lc, _mm_set1_epi8('a' - 1)),
+                                     _mm_cmplt_epi8(lc, _mm_set1_epi8('f' + 1)));
+    if (_mm_movemask_epi8(_mm_or_si128(is_digit, is_alpha)) != 0xFFFF)
+        *ok = 0;
+    return _mm_or_si128(_mm_and_si128(is_digit, _mm_sub_epi8(c, _mm_set1_epi8('0'))),
+                        _mm_and_si128(is_alpha, _mm_sub_epi8(lc, _mm_set1_epi8('a' - 10))));
+}
+
+static int
+hex_value(uint8_t c)
+{
+    if (c >= '0' && c <= '9')
+        return c - '0';
+    c |= 0x20;
+    if (c >= 'a' && c <= 'f')
+        return c - 'a' + 10;
+    return -1;
+}
+
+/* Decodes 2*n ASCII digits into n bytes; returns 0 on any non-hex character. */
+static int
+hex_decode_core(const uint8_t *in, size_t n, uint8_t *out)
+{
+    /* maddubs with (16, 1) byte pairs turns each (hi, lo) nibble pair into hi*16 + lo. */
+    const __m128i weights = _mm_set1_epi16(0x0110);
+    int ok = 1;
+    size_t i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m128i a = hex_nibbles16(_mm_loadu_si128((const __m128i *)(in + 2 * i)), &ok);
+        __m128i b = hex_nibbles16(_mm_loadu_si128((const __m128i *)(in + 2 * i + 16)), &ok);
+        if (!ok)
+            return 0;
+        a = _mm_maddubs_epi16(a, weights);
+        b = _mm_maddubs_epi16(b, weights);
+        _mm_storeu_si128((__m128i *)(out + i), _mm_packus_epi16(a, b));
+    }
+    for (; i < n; i++) {
+        int hi = hex_value(in[2 * i]), lo = hex_value(in[2 * i + 1]);
+        if (hi < 0 || lo < 0)
+            return 0;
+        out[i] = (uint8_t)(hi << 4 | lo);
+    }
+    return 1;
+}
+
+/* ---------------------------------------------------------------------------
+ * Python bindings
+ * ------------------------------------------------------------------------- */
+
+#define AES_VEC __m128i
+#define AES_LOAD(p) _mm_loadu_si128((const __m128i *)(p))
+#define AES_STORE(p, v) _mm_storeu_si128((__m128i *)(p), (v))
+#include "_aes_bindings.h"
+
+static PyObject *
+py_has_aesni(PyObject *self, PyObject *Py_UNUSED(args))
+{
+#if defined(__GNUC__)
+    __builtin_cpu_init();
+    return PyBool_FromLong(__builtin_cpu_supports("aes") && __builtin_cpu_supports("sse4.1"));
+#else
+    Py_RETURN_FALSE;
+#endif
+}
+
+static PyObject *
+py_has_vaes(PyObject *self, PyObject *Py_UNUSED(args))
+{
+    return PyBool_FromLong(use_vaes);
+}
+
+static PyObject *
+py_hex_encode_simd(PyObject *self, PyObject *args)
+{
+    Py_buffer data;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*", &data))
+        return NULL;
+    if (data.len > PY_SSIZE_T_MAX / 2) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    result = PyUnicode_New(data.len * 2, 127);
+    if (result != NULL)
+        hex_encode_core((const uint8_t *)data.buf, (size_t)data.len, PyUnicode_1BYTE_DATA(result));
+
+done:
+    PyBuffer_Release(&data);
+    return result;
+}
+
+static PyObject *
+py_hex_decode_simd(PyObject *self, PyObject *args)
+{
+    PyObject *text;
+
+    if (!PyArg_ParseTuple(args, "U", &text))
+        return NULL;
+    Py_ssize_t len = PyUnicode_GET_LENGTH(text);
+    /* Anything but plain ASCII hex digits is left to bytes.fromhex(). */
+    if (!PyUnicode_IS_ASCII(text) || len % 2 != 0)
+        Py_RETURN_NONE;
+
+    PyObject *result = PyBytes_FromStringAndSize(NULL, len / 2);
+    if (result == NULL)
+        return NULL;
+    if (!hex_decode_core(PyUnicode_1BYTE_DATA(text), (size_t)len / 2, (uint8_t *)PyBytes_AS_STRING(result))) {
+        Py_DECREF(result);
+        Py_RETURN_NONE;
+    }
+    return result;
+}
+
+static PyMethodDef aesni_methods[] = {
+    {"has_aesni", py_has_aesni, METH_NOARGS,
+     "Return True if the running CPU supports AES-NI and SSE4.1."},
+    {"has_vaes", py_has_vaes, METH_NOARGS,
+     "Return True if the VAES (AVX-512) bulk path is in use."},
+    AES_BINDINGS_METHODS,
+    {"hex_encode_simd", py_hex_encode_simd, METH_VARARGS,
+     "hex_encode_simd(data) -> str; same output as bytes.hex()."},
+    {"hex_decode_simd", py_hex_decode_simd, METH_VARARGS,
+     "hex_decode_simd(text) -> bytes, or None if text is not plain ASCII hex of even length."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef aesni_module = {
+    PyModuleDef_HEAD_INIT,
+    "_aesni",
+    "AES-128 ECB/CFB backed by x86 AES-NI.",
+    -1,
+    aesni_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__aesni(void)
+{
+#if HAVE_VAES_BUILD
+    __builtin_cpu_init();
+    use_vaes = __builtin_cpu_supports("vaes") && __builtin_cpu_supports("avx512f")
+               && __builtin_cpu_supports("avx512bw");
+#endif
+    return PyModule_Create(&aesni_module);
+}
@@ -0,0 +1,115 @@
+"""
+Numba JIT kernels for the pure-Python fallback (pip install numba).
+cipher.py imports this module only for inputs large enough to win back the cost
+of loading numba and compiling/loading the kernels on first use. The kernels
+repeat the T-table rounds of cipher._encrypt_block/_decrypt_block on uint32 arrays.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from .cipher import INV_S_BOX, S_BOX, TD0, TD1, TD2, TD3, TE0, TE1, TE2, TE3, _encrypt_block, _xor_bytes
+
+
+@njit(cache=True)
+def _aes_rounds(s0, s1, s2, s3, rk, t0, t1, t2, t3, sb):
+    s0 ^= rk[0]
+    s1 ^= rk[1]
+    s2 ^= rk[2]
+    s3 ^= rk[3]
+    for i in range(4, 40, 4):
+        a0 = t0[s0 >> 24] ^ t1[(s1 >> 16) & 0xFF] ^ t2[(s2 >> 8) & 0xFF] ^ t3[s3 & 0xFF] ^ rk[i]
+        a1 = t0[s1 >> 24] ^ t1[(s2 >> 16) & 0xFF] ^ t2[(s3 >> 8) & 0xFF] ^ t3[s0 & 0xFF] ^ rk[i + 1]
+        a2 = t0[s2 >> 24] ^ t1[(s3 >> 16) & 0xFF] ^ t2[(s0 >> 8) & 0xFF] ^ t3[s1 & 0xFF] ^ rk[i + 2]
+        a3 = t0[s3 >> 24] ^ t1[(s0 >> 16) & 0xFF] ^ t2[(s1 >> 8) & 0xFF] ^ t3[s2 & 0xFF] ^ rk[i + 3]
+        s0, s1, s2, s3 = a0, a1, a2, a3
+    return (
+        ((sb[s0 >> 24] << 24) | (sb[(s1 >> 16) & 0xFF] << 16) | (sb[(s2 >> 8) & 0xFF] << 8) | sb[s3 & 0xFF]) ^ rk[40],
+        ((sb[s1 >> 24] << 24) | (sb[(s2 >> 16) & 0xFF] << 16) | (sb[(s3 >> 8) & 0xFF] << 8) | sb[s0 & 0xFF]) ^ rk[41],
+        ((sb[s2 >> 24] << 24) | (sb[(s3 >> 16) & 0xFF] << 16) | (sb[(s0 >> 8) & 0xFF] << 8) | sb[s1 & 0xFF]) ^ rk[42],
+        ((sb[s3 >> 24] << 24) | (sb[(s0 >> 16) & 0xFF] << 16) | (sb[(s1 >> 8) & 0xFF] << 8) | sb[s2 & 0xFF]) ^ rk[43],
+    )
+
+@njit(cache=True)
+def _aes_inv_rounds(s0, s1, s2, s3, dk, t0, t1, t2, t3, ib):
+    s0 ^= dk[0]
+    s1 ^= dk[1]
+    s2 ^= dk[2]
+    s3 ^= dk[3]
+    for i in range(4, 40, 4):
+        a0 = t0[s0 >> 24] ^ t1[(s3 >> 16) & 0xFF] ^ t2[(s2 >> 8) & 0xFF] ^ t3[s1 & 0xFF] ^ dk[i]
+        a1 = t0[s1 >> 24] ^ t1[(s0 >> 16) & 0xFF] ^ t2[(s3 >> 8) & 0xFF] ^ t3[s2 & 0xFF] ^ dk[i + 1]
+        a2 = t0[s2 >> 24] ^ t1[(s1 >> 16) & 0xFF] ^ t2[(s0 >> 8) & 0xFF] ^ t3[s3 & 0xFF] ^ dk[i + 2]
+        a3 = t0[s3 >> 24] ^ t1[(s2 >> 16) & 0xFF] ^ t2[(s1 >> 8) & 0xFF] ^ t3[s0 & 0xFF] ^ dk[i + 3]
+        s0, s1, s2, s3 = a0, a1, a2, a3
+    return (
+        ((ib[s0 >> 24] << 24) | (ib[(s3 >> 16) & 0xFF] << 16) | (ib[(s2 >> 8) & 0xFF] << 8) | ib[s1 & 0xFF]) ^ dk[40],
+        ((ib[s1 >> 24] << 24) | (ib[(s0 >> 16) & 0xFF] << 16) | (ib[(s3 >> 8) & 0xFF] << 8) | ib[s2 & 0xFF]) ^ dk[41],
+        ((ib[s2 >> 24] << 24) | (ib[(s1 >> 16) & 0xFF] << 16) | (ib[(s0 >> 8) & 0xFF] << 8) | ib[s3 & 0xFF]) ^ dk[42],
+        ((ib[s3 >> 24] << 24) | (ib[(s2 >> 16) & 0xFF] << 16) | (ib[(s1 >> 8) & 0xFF] << 8) | ib[s0 & 0xFF]) ^ dk[43],
+    )
+
+@njit(cache=True, parallel=True)
+def _ecb_blocks(words, keys, t0, t1, t2, t3, sb, inverse):
+    """ECB over a uint32 word array; blocks are independent so they run in parallel."""
+    out = np.empty_like(words)
+    for b in prange(words.size // 4):
+        i = 4 * b
+        if inverse:
+            r = _aes_inv_rounds(words[i], words[i + 1], words[i + 2], words[i + 3], keys, t0, t1, t2, t3, sb)
+        else:
+            r = _aes_rounds(words[i], words[i + 1], words[i + 2], words[i + 3], keys, t0, t1, t2, t3, sb)
+        out[i], out[i + 1], out[i + 2], out[i + 3] = r
+    return out
+
+@njit(cache=True)
+def _cfb_encrypt_blocks(words, iv, rk, t0, t1, t2, t3, sb):
+    """CFB encrypt is serial: each keystream block depends on the previous ciphertext."""
+    out = np.empty_like(words)
+    f0, f1, f2, f3 = iv[0], iv[1], iv[2], iv[3]
+    for i in range(0, words.size, 4):
+        k0, k1, k2, k3 = _aes_rounds(f0, f1, f2, f3, rk, t0, t1, t2, t3, sb)
+        out[i] = k0 ^ words[i]
+        out[i + 1] = k1 ^ words[i + 1]
+        out[i + 2] = k2 ^ words[i + 2]
+        out[i + 3] = k3 ^ words[i + 3]
+        f0, f1, f2, f3 = out[i], out[i + 1], out[i + 2], out[i + 3]
+    return out
+
+
+_NP_ENC_TABLES = tuple(np.asarray(t, dtype=np.uint32) for t in (TE0, TE1, TE2, TE3, S_BOX))
+_NP_DEC_TABLES = tuple(np.asarray(t, dtype=np.uint32) for t in (TD0, TD1, TD2, TD3, INV_S_BOX))
+
+
+def _to_words(data: bytes):
+    return np.frombuffer(data, dtype=">u4").astype(np.uint32)
+
+
+def ecb(data: bytes, keys, inverse: bool) -> bytes:
+    """ECB-encrypt (or decrypt with a _dec_key_schedule() schedule) block-aligned data."""
+    if len(data) % 16 != 0:
+        raise ValueError("Data length must be a multiple of block size.")
+    tables = _NP_DEC_TABLES if inverse else _NP_ENC_TABLES
+    out = _ecb_blocks(_to_words(data), np.asarray(keys, dtype=np.uint32), *tables, inverse)
+    return out.astype(">u4").tobytes()
+
+
+def cfb(data: bytes, iv_bytes: bytes, round_keys, decrypt: bool) -> bytes:
+    """CFB over the full blocks with the JIT kernels; a partial tail is finished in Python."""
+    full_len = len(data) - (len(data) % 16)
+    rk = np.asarray(round_keys, dtype=np.uint32)
+    words = _to_words(data[:full_len])
+    if decrypt:
+        # Feedback is IV || C_0 .. C_{n-2}, all known up front.
+        feedback = np.concatenate((_to_words(iv_bytes), words))[:words.size]
+        keystream = _ecb_blocks(feedback, rk, *_NP_ENC_TABLES, False)
+        out = (keystream ^ words).astype(">u4").tobytes()
+        prev = data[full_len - 16:full_len] if full_len else iv_bytes
+    else:
+        out = _cfb_encrypt_blocks(words, _to_words(iv_bytes), rk, *_NP_ENC_TABLES).astype(">u4").tobytes()
+        prev = out[-16:] if full_len else iv_bytes
+    tail = data[full_len:]
+    if tail:
+        keystream = _encrypt_block(prev, round_keys)
+        out += _xor_bytes(tail, keystream[: len(tail)])
+    return out
@@ -0,0 +1,50 @@
+"""
+Detection of the optional native AES extensions, shared by cipher.py and helper.py.
+NATIVE is the extension usable on this CPU (aes_cipher._aesni on x86 with AES-NI,
+aes_cipher._aesarm on AArch64 with the crypto extensions), or None.
+"""
+
+import platform
+
+try:
+    from . import _aesni
+except ImportError:
+    _aesni = None
+
+try:
+    from . import _aesarm
+except ImportError:
+    _aesarm = None
+
+_X86_MACHINES = ("x86_64", "amd64", "i386", "i686", "x86")
+_ARM64_MACHINES = ("aarch64", "arm64")
+
+
+def _arm_has_aes() -> bool:
+    """Check the ARMv8 'aes' feature flag (always present on Apple Silicon)."""
+    if platform.system() == "Darwin":
+        return True
+    try:
+        with open("/proc/cpuinfo", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.lower().startswith("features"):
+                    return "aes" in line.split(":", 1)[1].split()
+    except OSError:
+        pass
+    return False
+
+
+def _select_native():
+    """Return the native AES module usable on this CPU, or None for pure Python."""
+    machine = platform.machine().lower()
+    if machine in _X86_MACHINES and _aesni is not None and _aesni.has_aesni():
+        return _aesni
+    if machine in _ARM64_MACHINES and _aesarm is not None and _arm_has_aes():
+        return _aesarm
+    return None
+
+
+NATIVE = _select_native()
+
+# The SIMD hex codec is only in the x86 extension (AES-NI CPUs all have SSSE3).
+HEX_SIMD = NATIVE if NATIVE is _aesni else None
@@ -1,10 +1,14 @@
 """
-AES-128 cipher logic placeholder.
-Implement encrypt/decrypt (ECB/CFB) here.
+AES-128 cipher logic (ECB/CFB).
+Uses a native extension when the CPU supports it (aes_cipher._aesni on x86,
+aes_cipher._aesarm on AArch64), otherwise the pure-Python implementation below.
 """
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
+import functools
+import importlib.util
 import os
+import struct
 
 # AES S-box and inverse S-box
 S_BOX = [
@@ -73,6 +77,7 @@ HEX_TO_NIBBLE = {
 # Rcon for AES-128 (10 rounds, index from 1)
 RCON = [0x00, 0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36]
 
+from ._native import NATIVE as _NATIVE
 from .helper import (
     chunk_blocks,
     hex_decode,
@@ -84,232 +89,354 @@ from .helper import (
     utf8_to_bytes,
 )
 
+# The Numba kernels (aes_cipher._jit) are only used without a native backend, and only
+# for large inputs: importing numba and the first kernel call cost ~0.35 s, which pure
+# Python needs about 512 KiB of input to spend.
+_USE_JIT = _NATIVE is None and importlib.util.find_spec("numba") is not None
+_JIT_MIN_BLOCKS = 32768
 
-def _mul(a: int, b: int) -> int:
-    """GF(2^8) multiplication."""
+
+def _xtime(a: int) -> int:
+    """Multiply by x (i.e. 2) in GF(2^8)."""
+    a <<= 1
+    return (a ^ 0x11B) if a & 0x100 else a
+
+
+def _gmul(a: int, b: int) -> int:
+    """GF(2^8) multiplication (only used to build the tables below)."""
     p = 0
-    for _ in range(8):
+    while b:
         if b & 1:
             p ^= a
-        hi_bit = a & 0x80
-        a = (a << 1) & 0xFF
-        if hi_bit:
-            a ^= 0x1B
+        a = _xtime(a)
         b >>= 1
     return p
 
 
-def _sub_bytes(state):
-    for i in range(16):
-        state[i] = S_BOX[state[i]]
-    return state
+def _ror32(w: int, n: int) -> int:
+    return ((w >> n) | (w << (32 - n))) & 0xFFFFFFFF
 
 
-def _inv_sub_bytes(state):
-    for i in range(16):
-        state[i] = INV_S_BOX[state[i]]
-    return state
-
+def _build_t_tables(sbox, coeffs):
+    """
+    Build four 256-entry T-tables folding SubBytes and (Inv)MixColumns.
+    coeffs are the first column of the (inverse) MixColumns matrix, top to bottom;
+    tables 1..3 are byte rotations of table 0.
+    """
+    c0, c1, c2, c3 = coeffs
+    t0 = []
+    for x in range(256):
+        s = sbox[x]
+        t0.append((_gmul(s, c0) << 24) | (_gmul(s, c1) << 16) | (_gmul(s, c2) << 8) | _gmul(s, c3))
+    return (t0,) + tuple([_ror32(w, n) for w in t0] for n in (8, 16, 24))
 
-def _shift_rows(state):
-    state[1], state[5], state[9], state[13] = state[5], state[9], state[13], state[1]
-    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
-    state[3], state[7], state[11], state[15] = state[15], state[3], state[7], state[11]
-    return state
 
+# State is four big-endian 32-bit column words (FIPS-197 byte order, row 0 in the MSB).
+TE0, TE1, TE2, TE3 = _build_t_tables(S_BOX, (0x02, 0x01, 0x01, 0x03))
+TD0, TD1, TD2, TD3 = _build_t_tables(INV_S_BOX, (0x0E, 0x09, 0x0D, 0x0B))
 
-def _inv_shift_rows(state):
-    state[1], state[5], state[9], state[13] = state[13], state[1], state[5], state[9]
-    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
-    state[3], state[7], state[11], state[15] = state[7], state[11], state[15], state[3]
-    return state
+_BLOCK_WORDS = struct.Struct(">4I")
 
 
-def _mix_single_column(col):
-    a0, a1, a2, a3 = col
-    return [
-        _mul(a0, 2) ^ _mul(a1, 3) ^ a2 ^ a3,
-        a0 ^ _mul(a1, 2) ^ _mul(a2, 3) ^ a3,
-        a0 ^ a1 ^ _mul(a2, 2) ^ _mul(a3, 3),
-        _mul(a0, 3) ^ a1 ^ a2 ^ _mul(a3, 2),
-    ]
+def _key_expansion(key_bytes: bytes):
+    """Generate the 44 round-key words (11 round keys x 4 columns) for AES-128."""
+    assert len(key_bytes) == 16
+    w = list(_BLOCK_WORDS.unpack(key_bytes))
+    for i in range(4, 44):
+        t = w[i - 1]
+        if i % 4 == 0:
+            # RotWord + SubWord + Rcon
+            t = ((S_BOX[(t >> 16) & 0xFF] << 24) | (S_BOX[(t >> 8) & 0xFF] << 16)
+                 | (S_BOX[t & 0xFF] << 8) | S_BOX[t >> 24]) ^ (RCON[i // 4] << 24)
+        w.append(w[i - 4] ^ t)
+    return w
+
+
+def _inv_mix_word(w: int) -> int:
+    # TDn[S[x]] cancels the inverse S-box, leaving InvMixColumns of a single byte.
+    return (TD0[S_BOX[w >> 24]] ^ TD1[S_BOX[(w >> 16) & 0xFF]]
+            ^ TD2[S_BOX[(w >> 8) & 0xFF]] ^ TD3[S_BOX[w & 0xFF]])
+
+
+def _dec_key_schedule(rk):
+    """Equivalent inverse cipher schedule (FIPS-197 5.3.5): reversed, InvMixColumns on rounds 1..9."""
+    dk = list(rk[40:44])
+    for r in range(9, 0, -1):
+        dk.extend(_inv_mix_word(w) for w in rk[4 * r:4 * r + 4])
+    dk.extend(rk[0:4])
+    return dk
+
+
+def _encrypt_block(block: bytes, rk) -> bytes:
+    s0, s1, s2, s3 = _BLOCK_WORDS.unpack(block)
+    s0 ^= rk[0]
+    s1 ^= rk[1]
+    s2 ^= rk[2]
+    s3 ^= rk[3]
+    for i in range(4, 40, 4):
+        t0 = TE0[s0 >> 24] ^ TE1[(s1 >> 16) & 0xFF] ^ TE2[(s2 >> 8) & 0xFF] ^ TE3[s3 & 0xFF] ^ rk[i]
+        t1 = TE0[s1 >> 24] ^ TE1[(s2 >> 16) & 0xFF] ^ TE2[(s3 >> 8) & 0xFF] ^ TE3[s0 & 0xFF] ^ rk[i + 1]
+        t2 = TE0[s2 >> 24] ^ TE1[(s3 >> 16) & 0xFF] ^ TE2[(s0 >> 8) & 0xFF] ^ TE3[s1 & 0xFF] ^ rk[i + 2]
+        t3 = TE0[s3 >> 24] ^ TE1[(s0 >> 16) & 0xFF] ^ TE2[(s1 >> 8) & 0xFF] ^ TE3[s2 & 0xFF] ^ rk[i + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+    # final round: SubBytes + ShiftRows only
+    sb = S_BOX
+    return _BLOCK_WORDS.pack(
+        ((sb[s0 >> 24] << 24) | (sb[(s1 >> 16) & 0xFF] << 16) | (sb[(s2 >> 8) & 0xFF] << 8) | sb[s3 & 0xFF]) ^ rk[40],
+        ((sb[s1 >> 24] << 24) | (sb[(s2 >> 16) & 0xFF] << 16) | (sb[(s3 >> 8) & 0xFF] << 8) | sb[s0 & 0xFF]) ^ rk[41],
+        ((sb[s2 >> 24] << 24) | (sb[(s3 >> 16) & 0xFF] << 16) | (sb[(s0 >> 8) & 0xFF] << 8) | sb[s1 & 0xFF]) ^ rk[42],
+        ((sb[s3 >> 24] << 24) | (sb[(s0 >> 16) & 0xFF] << 16) | (sb[(s1 >> 8) & 0xFF] << 8) | sb[s2 & 0xFF]) ^ rk[43],
+    )
+
+
+def _decrypt_block(block: bytes, dk) -> bytes:
+    """Decrypt one block with the schedule from _dec_key_schedule()."""
+    s0, s1, s2, s3 = _BLOCK_WORDS.unpack(block)
+    s0 ^= dk[0]
+    s1 ^= dk[1]
+    s2 ^= dk[2]
+    s3 ^= dk[3]
+    for i in range(4, 40, 4):
+        t0 = TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xFF] ^ TD2[(s2 >> 8) & 0xFF] ^ TD3[s1 & 0xFF] ^ dk[i]
+        t1 = TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xFF] ^ TD2[(s3 >> 8) & 0xFF] ^ TD3[s2 & 0xFF] ^ dk[i + 1]
+        t2 = TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xFF] ^ TD2[(s0 >> 8) & 0xFF] ^ TD3[s3 & 0xFF] ^ dk[i + 2]
+        t3 = TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xFF] ^ TD2[(s1 >> 8) & 0xFF] ^ TD3[s0 & 0xFF] ^ dk[i + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+    # final round: InvSubBytes + InvShiftRows only
+    ib = INV_S_BOX
+    return _BLOCK_WORDS.pack(
+        ((ib[s0 >> 24] << 24) | (ib[(s3 >> 16) & 0xFF] << 16) | (ib[(s2 >> 8) & 0xFF] << 8) | ib[s1 & 0xFF]) ^ dk[40],
+        ((ib[s1 >> 24] << 24) | (ib[(s0 >> 16) & 0xFF] << 16) | (ib[(s3 >> 8) & 0xFF] << 8) | ib[s2 & 0xFF]) ^ dk[41],
+        ((ib[s2 >> 24] << 24) | (ib[(s1 >> 16) & 0xFF] << 16) | (ib[(s0 >> 8) & 0xFF] << 8) | ib[s3 & 0xFF]) ^ dk[42],
+        ((ib[s3 >> 24] << 24) | (ib[(s2 >> 16) & 0xFF] << 16) | (ib[(s1 >> 8) & 0xFF] << 8) | ib[s0 & 0xFF]) ^ dk[43],
+    )
+
+
+def _xor_bytes(a: bytes, b: bytes) -> bytes:
+    """XOR two equal-length buffers as one big int instead of byte by byte."""
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_key(key_bytes: bytes) -> bytes:
+    """Serialized 176-byte key schedule for the native backend, cached per key."""
+    return _NATIVE.expand_key(key_bytes)
+
+
+@functools.lru_cache(maxsize=32)
+def _key_schedule_words(key_bytes: bytes, inverse: bool, /) -> tuple:
+    """
+    44 round-key words for the Python/JIT paths (equivalent-inverse form if inverse), cached per key.
+    Both arguments are positional-only so every call shares one lru_cache entry per schedule.
+    """
+    round_keys = _key_expansion(key_bytes)
+    return tuple(_dec_key_schedule(round_keys) if inverse else round_keys)
 
 
-def _inv_mix_single_column(col):
-    a0, a1, a2, a3 = col
-    return [
-        _mul(a0, 0x0E) ^ _mul(a1, 0x0B) ^ _mul(a2, 0x0D) ^ _mul(a3, 0x09),
-        _mul(a0, 0x09) ^ _mul(a1, 0x0E) ^ _mul(a2, 0x0B) ^ _mul(a3, 0x0D),
-        _mul(a0, 0x0D) ^ _mul(a1, 0x09) ^ _mul(a2, 0x0E) ^ _mul(a3, 0x0B),
-        _mul(a0, 0x0B) ^ _mul(a1, 0x0D) ^ _mul(a2, 0x09) ^ _mul(a3, 0x0E),
+@functools.lru_cache(maxsize=32)
+def _specialized_block(keys: tuple, inverse: bool = False):
+    """
+    Compile a block function for one fixed key schedule: rounds unrolled and every
+    round-key word inlined as an integer literal, so no key list is indexed per block.
+    Returns f(block) equal to _encrypt_block(block, keys) (or _decrypt_block when inverse).
+    """
+    if inverse:
+        tbl, sbox, order = "TD", "INV_S_BOX", (0, 3, 2, 1)
+    else:
+        tbl, sbox, order = "TE", "S_BOX", (0, 1, 2, 3)
+
+    def cols(prefix, j):
+        return [f"{prefix}{(j + o) % 4}" for o in order]
+
+    lines = [
+        f"def block(b, T0={tbl}0, T1={tbl}1, T2={tbl}2, T3={tbl}3, sb={sbox},"
+        " unpack=_BLOCK_WORDS.unpack, pack=_BLOCK_WORDS.pack):",
+        "    s0, s1, s2, s3 = unpack(b)",
     ]
+    lines += [f"    s{j} ^= {keys[j]:#x}" for j in range(4)]
+    src, dst = "s", "t"
+    for rnd in range(1, 10):
+        for j in range(4):
+            a, b, c, d = cols(src, j)
+            lines.append(
+                f"    {dst}{j} = T0[{a} >> 24] ^ T1[({b} >> 16) & 0xFF] ^ T2[({c} >> 8) & 0xFF]"
+                f" ^ T3[{d} & 0xFF] ^ {keys[4 * rnd + j]:#x}"
+            )
+        src, dst = dst, src
+    final = []
+    for j in range(4):
+        a, b, c, d = cols(src, j)
+        final.append(
+            f"((sb[{a} >> 24] << 24) | (sb[({b} >> 16) & 0xFF] << 16) | (sb[({c} >> 8) & 0xFF] << 8)"
+            f" | sb[{d} & 0xFF]) ^ {keys[40 + j]:#x}"
+        )
+    lines.append("    return pack(" + ", ".join(final) + ")")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<aes-specialized>", "exec"), globals(), namespace)
+    return namespace["block"]
+
+
+# Generating a specialized block function costs about 1 ms, which only pays off
+# over roughly 1024 blocks (or when the same key is used again in this process).
+_SPECIALIZE_MIN_BLOCKS = 1024
+
+
+def _python_block_function(key_bytes: bytes, nblocks: int, inverse: bool = False):
+    """Block function for the pure-Python path: specialized for long inputs or a reused key, generic otherwise."""
+    hits = _key_schedule_words.cache_info().hits
+    keys = _key_schedule_words(key_bytes, inverse)
+    if nblocks >= _SPECIALIZE_MIN_BLOCKS or _key_schedule_words.cache_info().hits > hits:
+        return _specialized_block(keys, inverse)
+    block_fn = _decrypt_block if inverse else _encrypt_block
+    return lambda block: block_fn(block, keys)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_jit():
+    """Import the Numba kernels on first use; None if numba cannot be imported."""
+    try:
+        from . import _jit
+    except ImportError:
+        return None
+    return _jit
 
 
-def _mix_columns(state):
-    for c in range(4):
-        col = state[c * 4:(c + 1) * 4]
-        state[c * 4:(c + 1) * 4] = _mix_single_column(col)
-    return state
-
-
-def _inv_mix_columns(state):
-    for c in range(4):
-        col = state[c * 4:(c + 1) * 4]
-        state[c * 4:(c + 1) * 4] = _inv_mix_single_column(col)
-    return state
-
-
-def _add_round_key(state, round_key):
-    return [s ^ k for s, k in zip(state, round_key)]
-
-
-def _rot_word(word):
-    return word[1:] + word[:1]
-
-
-def _sub_word(word):
-    return [S_BOX[b] for b in word]
+def _jit_for(nblocks: int):
+    """The Numba kernels if they are enabled and nblocks is large enough to use them, else None."""
+    if _USE_JIT and nblocks >= _JIT_MIN_BLOCKS:
+        return _load_jit()
+    return None
 
 
-def _key_expansion(key_bytes: bytes):
-    """Generate 44 words (4 bytes each) for AES-128."""
-    assert len(key_bytes) == 16
-    words = [list(key_bytes[i:i + 4]) for i in range(0, 16, 4)]
-    for i in range(4, 44):
-        temp = words[i - 1].copy()
-        if i % 4 == 0:
-            temp = _sub_word(_rot_word(temp))
-            temp[0] ^= RCON[i // 4]
-        new_word = [temp[j] ^ words[i - 4][j] for j in range(4)]
-        words.append(new_word)
-    # flatten round keys: 11 round keys x 16 bytes
-    round_keys = []
-    for r in range(11):
-        rk = []
-        for w in words[r * 4:(r + 1) * 4]:
-            rk.extend(w)
-        round_keys.append(rk)
-    return round_keys
-
-
-def _state_from_block(block: bytes):
-    """Create state (list of 16 bytes) column-major from 16-byte block."""
-    return [block[r + 4 * c] for c in range(4) for r in range(4)]
-
-
-def _block_from_state(state):
-    """Convert state list back to bytes (column-major)."""
-    out = bytearray(16)
-    for c in range(4):
-        for r in range(4):
-            out[r + 4 * c] = state[c * 4 + r]
-    return bytes(out)
-
-
-def _encrypt_block(block: bytes, round_keys):
-    state = _state_from_block(block)
-    state = _add_round_key(state, round_keys[0])
-    for rnd in range(1, 10):
-        state = _sub_bytes(state)
-        state = _shift_rows(state)
-        state = _mix_columns(state)
-        state = _add_round_key(state, round_keys[rnd])
-    # final round
-    state = _sub_bytes(state)
-    state = _shift_rows(state)
-    state = _add_round_key(state, round_keys[10])
-    return _block_from_state(state)
-
-
-def _decrypt_block(block: bytes, round_keys):
-    state = _state_from_block(block)
-    state = _add_round_key(state, round_keys[10])
-    state = _inv_shift_rows(state)
-    state = _inv_sub_bytes(state)
-    for rnd in range(9, 0, -1):
-        state = _add_round_key(state, round_keys[rnd])
-        state = _inv_mix_columns(state)
-        state = _inv_shift_rows(state)
-        state = _inv_sub_bytes(state)
-    state = _add_round_key(state, round_keys[0])
-    return _block_from_state(state)
-
-
-def encrypt(plaintext: str, key: str, mode: str = "ecb", iv: Optional[str] = None) -> Tuple[str, Optional[str]]:
+def encrypt(
+    plaintext: Union[str, bytes, bytearray, memoryview],
+    key: str,
+    mode: str = "ecb",
+    iv: Optional[str] = None,
+) -> Tuple[str, Optional[str]]:
     """
     Encrypt plaintext with AES-128.
+    plaintext is UTF-8 encoded if it is a str; bytes-like input is used as is, without a copy
+    (use decrypt_bytes() to get binary plaintext back).
     Returns (cipher_hex, iv_hex) where iv_hex is None for ECB.
     """
     mode = mode.lower()
     key_bytes = normalize_aes_key(key)
-    round_keys = _key_expansion(key_bytes)
+    if isinstance(plaintext, str):
+        plain_bytes = utf8_to_bytes(plaintext)
+    else:
+        plain_bytes = memoryview(plaintext).cast("B")
 
     if mode == "ecb":
-        data = pkcs7_pad(utf8_to_bytes(plaintext), 16)
+        data = pkcs7_pad(plain_bytes, 16)
+        if _NATIVE is not None:
+            # ECB may run in place: the padded copy is already ours.
+            _NATIVE.aes128_ecb_encrypt(_expand_key(key_bytes), data, data)
+            return hex_encode(data), None
+        jit = _jit_for(len(data) // 16)
+        if jit is not None:
+            return hex_encode(jit.ecb(data, _key_schedule_words(key_bytes, False), inverse=False)), None
+        encrypt_block = _python_block_function(key_bytes, len(data) // 16)
         out = bytearray()
         for block in chunk_blocks(data, 16):
-            out.extend(_encrypt_block(block, round_keys))
+            out.extend(encrypt_block(block))
         return hex_encode(bytes(out)), None
 
     if mode == "cfb":
         iv_bytes = normalize_iv(iv) if iv is not None else os.urandom(16)
-        data = utf8_to_bytes(plaintext)
+        data = plain_bytes
+        if _NATIVE is not None:
+            out = bytearray(len(data))
+            _NATIVE.aes128_cfb_encrypt(_expand_key(key_bytes), iv_bytes, data, out)
+            return hex_encode(out), hex_encode(iv_bytes)
+        jit = _jit_for(len(data) // 16)
+        if jit is not None:
+            out = jit.cfb(data, iv_bytes, _key_schedule_words(key_bytes, False), decrypt=False)
+            return hex_encode(out), hex_encode(iv_bytes)
+        encrypt_block = _python_block_function(key_bytes, (len(data) + 15) // 16)
         out = bytearray()
         prev = iv_bytes
         full_len = len(data) - (len(data) % 16)
         for i in range(0, full_len, 16):
             block = data[i:i + 16]
-            keystream = _encrypt_block(prev, round_keys)
-            cipher_block = bytes(b ^ k for b, k in zip(block, keystream))
+            keystream = encrypt_block(prev)
+            cipher_block = _xor_bytes(block, keystream)
             out.extend(cipher_block)
             prev = cipher_block
         if len(data) % 16:
             tail = data[full_len:]
-            keystream = _encrypt_block(prev, round_keys)
-            cipher_tail = bytes(b ^ k for b, k in zip(tail, keystream[: len(tail)]))
+            keystream = encrypt_block(prev)
+            cipher_tail = _xor_bytes(tail, keystream[: len(tail)])
             out.extend(cipher_tail)
         return hex_encode(bytes(out)), hex_encode(iv_bytes)
 
     raise ValueError("Unsupported mode. Use 'ecb' or 'cfb'.")
 
 
-def decrypt(ciphertext: str, key: str, mode: str = "ecb", iv: Optional[str] = None) -> str:
+def decrypt_bytes(ciphertext: str, key: str, mode: str = "ecb", iv: Optional[str] = None) -> bytes:
     """
-    Decrypt ciphertext with AES-128.
+    Decrypt ciphertext with AES-128 and return the raw plaintext bytes.
+    Use this for ciphertext made from binary (non-UTF-8) input to encrypt().
     """
     mode = mode.lower()
     key_bytes = normalize_aes_key(key)
-    round_keys = _key_expansion(key_bytes)
     try:
         data = hex_decode(ciphertext)
     except ValueError:
         raise ValueError("Ciphertext must be a valid hex string.")
 
     if mode == "ecb":
+        if _NATIVE is not None:
+            out = bytearray(len(data))
+            _NATIVE.aes128_ecb_decrypt(_expand_key(key_bytes), data, out)
+            pad_len = _NATIVE.pkcs7_unpad_len(out)
+            if not pad_len:
+                raise ValueError("Invalid padding.")
+            return bytes(memoryview(out)[:-pad_len])
+        jit = _jit_for(len(data) // 16)
+        if jit is not None:
+            dec_keys = _key_schedule_words(key_bytes, True)
+            return pkcs7_unpad(jit.ecb(data, dec_keys, inverse=True), 16)
+        decrypt_block = _python_block_function(key_bytes, len(data) // 16, inverse=True)
         out = bytearray()
         for block in chunk_blocks(data, 16):
-            out.extend(_decrypt_block(block, round_keys))
-        unpadded = pkcs7_unpad(bytes(out), 16)
-        return unpadded.decode("utf-8")
+            out.extend(decrypt_block(block))
+        return pkcs7_unpad(bytes(out), 16)
 
     if mode == "cfb":
         if iv is None:
             raise ValueError("IV is required for CFB mode.")
         iv_bytes = normalize_iv(iv)
+        if _NATIVE is not None:
+            out = bytearray(len(data))
+            _NATIVE.aes128_cfb_decrypt(_expand_key(key_bytes), iv_bytes, data, out)
+            return bytes(out)
+        jit = _jit_for(len(data) // 16)
+        if jit is not None:
+            return jit.cfb(data, iv_bytes, _key_schedule_words(key_bytes, False), decrypt=True)
+        encrypt_block = _python_block_function(key_bytes, (len(data) + 15) // 16)
         out = bytearray()
         prev = iv_bytes
         full_len = len(data) - (len(data) % 16)
         for i in range(0, full_len, 16):
             block = data[i:i + 16]
-            keystream = _encrypt_block(prev, round_keys)
-            plain_block = bytes(b ^ k for b, k in zip(block, keystream))
+            keystream = encrypt_block(prev)
+            plain_block = _xor_bytes(block, keystream)
             out.extend(plain_block)
             prev = block
         if len(data) % 16:
             tail = data[full_len:]
-            keystream = _encrypt_block(prev, round_keys)
-            plain_tail = bytes(b ^ k for b, k in zip(tail, keystream[: len(tail)]))
+            keystream = encrypt_block(prev)
+            plain_tail = _xor_bytes(tail, keystream[: len(tail)])
             out.extend(plain_tail)
-        return bytes(out).decode("utf-8")
+        return bytes(out)
 
     raise ValueError("Unsupported mode. Use 'ecb' or 'cfb'.")
+
+
+def decrypt(ciphertext: str, key: str, mode: str = "ecb", iv: Optional[str] = None) -> str:
+    """
+    Decrypt ciphertext with AES-128 and decode the plaintext as UTF-8.
+    """
+    return decrypt_bytes(ciphertext, key, mode=mode, iv=iv).decode("utf-8")
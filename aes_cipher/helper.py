@@ -1,55 +1,102 @@
-"""Helper utilities for AES (16-byte blocks, hex/text handling)."""
+"""
+Helper utilities for AES (16-byte blocks, hex/text handling).
+Key/IV hex parsing and PKCS#7 unpadding classify every byte with the same
+operations and only branch on the combined result, so their timing does not
+reveal where in the input a bad byte is.
+"""
+
+from ._native import HEX_SIMD as _HEX_SIMD
+
+# SIMD hex only pays off past the call overhead.
+_SIMD_HEX_MIN_BYTES = 256
+
+# Every PKCS#7 padding string for block sizes up to 16 (AES), built once.
+_PKCS7_PADS = tuple(bytes((n,)) * n for n in range(1, 17))
+
+
+def _hex_scan(raw: bytes):
+    """Return (value, bad): the hex digits as one big-endian int; bad is nonzero if any byte is not [0-9a-fA-F]."""
+    value = 0
+    bad = 0
+    for c in raw:
+        lc = c | 0x20
+        # (lo - 1 - x) & (x - hi - 1) is negative exactly when lo <= x <= hi
+        is_digit = (((0x2F - c) & (c - 0x3A)) >> 8) & 1
+        is_alpha = (((0x60 - lc) & (lc - 0x67)) >> 8) & 1
+        bad |= 1 ^ (is_digit | is_alpha)
+        value = (value << 4) | (is_digit * (c - 0x30)) | (is_alpha * (lc - 0x57))
+    return value, bad
+
+
+def _hex_or_text(text: str, size: int) -> bytes:
+    """
+    Parse a key/IV string: 2*size hex digits, otherwise the UTF-8 bytes of text.
+    A 2*size-char string that is not hex encodes to at least 2*size bytes, so it
+    always fails the caller's length check rather than picking a different value.
+    """
+    raw = utf8_to_bytes(text)
+    if len(text) != 2 * size:
+        return raw
+    value, bad = _hex_scan(raw)
+    return raw if bad else value.to_bytes(size, "big")
+
 
 def utf8_to_bytes(text: str) -> bytes:
     """Encode text to UTF-8 bytes (strict)."""
     return text.encode("utf-8")
 
 
-def pkcs7_pad(data: bytes, block_size: int = 16) -> bytes:
+def pkcs7_pad(data: bytes, block_size: int = 16) -> bytearray:
     """
     Apply PKCS#7 padding to reach a multiple of block_size.
+    data may be any C-contiguous buffer; it is copied once into a new bytearray.
     Note: block_size must fit in one byte (1..255) because padding value is stored in a single byte.
     """
     if block_size <= 0 or block_size > 255:
         raise ValueError("block_size must be in range 1..255")
-    pad_len = block_size - (len(data) % block_size)
-    return data + bytes([pad_len] * pad_len)
+    mv = memoryview(data).cast("B")
+    n = len(mv)
+    pad_len = block_size - (n % block_size)
+    padded = bytearray(n + pad_len)
+    padded[:n] = mv
+    padded[n:] = _PKCS7_PADS[pad_len - 1] if pad_len <= len(_PKCS7_PADS) else bytes((pad_len,)) * pad_len
+    return padded
 
 
 def pkcs7_unpad(data: bytes, block_size: int = 16) -> bytes:
-    """Remove PKCS#7 padding; raises ValueError on bad padding."""
+    """Remove PKCS#7 padding (the whole last block is checked); raises ValueError on bad padding."""
     if not data or len(data) % block_size != 0:
         raise ValueError("Invalid padded data length.")
     pad_len = data[-1] # get value of last byte
-    if pad_len == 0 or pad_len > block_size:
-        raise ValueError("Invalid padding byte.")
-    if data[-pad_len:] != bytes([pad_len] * pad_len): # check padding content (last pad_len bytes)
-        raise ValueError("Invalid padding content.")
+    bad = ((pad_len - 1) & 0xFF) >= block_size # pad_len outside 1..block_size
+    for i in range(1, block_size + 1): # i-th byte from the end; only the last pad_len count
+        bad |= (i <= pad_len) * (data[-i] ^ pad_len)
+    if bad:
+        raise ValueError("Invalid padding.")
     return data[:-pad_len]
 
 
 def chunk_blocks(data: bytes, block_size: int = 16):
-    """Yield successive blocks of size block_size from data; length must be multiple of block_size."""
-    if len(data) % block_size != 0:
+    """
+    Yield successive blocks of size block_size from data; length must be multiple of block_size.
+    Blocks are zero-copy memoryview slices; call bytes(block) if a copy is needed.
+    """
+    mv = memoryview(data)
+    n = len(mv)
+    if n % block_size != 0:
         raise ValueError("Data length must be a multiple of block size.")
-    for i in range(0, len(data), block_size):
-        yield data[i:i + block_size]
+    for i in range(0, n, block_size):
+        yield mv[i:i + block_size]
 
 
 def normalize_aes_key(key_str: str) -> bytes:
     """
     Normalize user key string into 16-byte AES key.
-    Accepts 32 hex chars (case-insensitive) or 16 UTF-8 chars.
+    Accepts 32 hex chars (case-insensitive) or text that is 16 bytes in UTF-8.
+    Leading/trailing whitespace is stripped first, so it cannot be part of a text key.
     Raises ValueError otherwise.
     """
-    stripped = key_str.strip()
-    if len(stripped) == 32:
-        try:
-            key_bytes = bytes.fromhex(stripped)
-        except ValueError:
-            key_bytes = utf8_to_bytes(key_str)
-    else:
-        key_bytes = utf8_to_bytes(key_str)
+    key_bytes = _hex_or_text(key_str.strip(), 16)
 
     if len(key_bytes) != 16:
         raise ValueError("AES-128 key must be exactly 16 bytes (32 hex or 16 chars).")
@@ -59,16 +106,10 @@ def normalize_aes_key(key_str: str) -> bytes:
 def normalize_iv(iv_str: str, size: int = 16) -> bytes:
     """
     Normalize IV string into 'size' bytes (default 16 for AES).
-    Accepts hex string of length 2*size or UTF-8 text of length size.
+    Accepts hex string of length 2*size or text that is 'size' bytes in UTF-8.
+    Leading/trailing whitespace is stripped first, as for keys.
     """
-    stripped = iv_str.strip()
-    if len(stripped) == 2 * size:
-        try:
-            iv_bytes = bytes.fromhex(stripped)
-        except ValueError:
-            iv_bytes = utf8_to_bytes(iv_str)
-    else:
-        iv_bytes = utf8_to_bytes(iv_str)
+    iv_bytes = _hex_or_text(iv_str.strip(), size)
 
     if len(iv_bytes) != size:
         raise ValueError(f"IV must be exactly {size} bytes.")
@@ -77,9 +118,17 @@ def normalize_iv(iv_str: str, size: int = 16) -> bytes:
 
 def hex_encode(data: bytes) -> str:
     """Hex-encode bytes to string."""
+    if _HEX_SIMD is not None and len(data) > _SIMD_HEX_MIN_BYTES:
+        return _HEX_SIMD.hex_encode_simd(data)
     return data.hex()
 
 
 def hex_decode(text: str) -> bytes:
     """Decode hex string to bytes; raises ValueError on invalid hex."""
-    return bytes.fromhex(text.strip())
+    stripped = text.strip()
+    if _HEX_SIMD is not None and len(stripped) > 2 * _SIMD_HEX_MIN_BYTES:
+        decoded = _HEX_SIMD.hex_decode_simd(stripped)
+        if decoded is not None:
+            return decoded
+    # bytes.fromhex also handles spaced input and reports invalid characters.
+    return bytes.fromhex(stripped)
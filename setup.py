@@ -0,0 +1,36 @@
+"""
+Build hooks for the optional native AES backends.
+Project metadata lives in pyproject.toml; this file only declares C extensions.
+If a backend fails to compile, the package still installs and cipher.py
+uses the pure-Python implementation.
+"""
+
+import platform
+
+from setuptools import Extension, setup
+
+ext_modules = []
+machine = platform.machine().lower()
+
+if machine in ("x86_64", "amd64", "i386", "i686", "x86"):
+    ext_modules.append(
+        Extension(
+            "aes_cipher._aesni",
+            sources=["aes_cipher/_aesni.c"],
+            depends=["aes_cipher/_aes_bindings.h"],
+            extra_compile_args=["-O3", "-maes", "-msse4.1"],
+            optional=True,
+        )
+    )
+elif machine in ("aarch64", "arm64"):
+    ext_modules.append(
+        Extension(
+            "aes_cipher._aesarm",
+            sources=["aes_cipher/_aesarm.c"],
+            depends=["aes_cipher/_aes_bindings.h"],
+            extra_compile_args=["-O3", "-march=armv8-a+crypto"],
+            optional=True,
+        )
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,133 @@
+"""AES-128 backends: FIPS-197 vector and ECB/CFB round trips on every available backend."""
+
+import os
+import random
+import unittest
+from unittest import mock
+
+from aes_cipher import cipher
+from aes_cipher.workflows import _strip_saved_header
+
+# FIPS-197 Appendix C.1
+FIPS_KEY = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+FIPS_PT = bytes.fromhex("00112233445566778899aabbccddeeff")
+FIPS_CT = bytes.fromhex("69c4e0d86a7b0430d8cdb78070b4c55a")
+FIPS_LAST_ROUND_KEY = bytes.fromhex("13111d7fe3944a17f307a78b4d2b30c5")
+
+# Numba kernels, imported directly so they are tested even when a native backend is present.
+JIT = cipher._load_jit()
+
+KEY = "qtungdeptraivcll"
+IV = "fe80be646096e72387b233d65af80461"
+
+
+def available_backends():
+    """(name, native module, use_jit) for every backend usable in this environment."""
+    found = [("python", None, False)]
+    if cipher._NATIVE is not None:
+        found.append((cipher._NATIVE.__name__, cipher._NATIVE, False))
+    if JIT is not None:
+        found.append(("numba", None, True))
+    return found
+
+
+def use_backend(native, use_jit):
+    # With the JIT threshold at 0, every test input goes through the kernels when use_jit is set.
+    return mock.patch.multiple(cipher, _NATIVE=native, _USE_JIT=use_jit, _JIT_MIN_BLOCKS=0)
+
+
+class FipsVectorTest(unittest.TestCase):
+    def test_python_reference(self):
+        rk = cipher._key_expansion(FIPS_KEY)
+        self.assertEqual(cipher._BLOCK_WORDS.pack(*rk[40:44]), FIPS_LAST_ROUND_KEY)
+        self.assertEqual(cipher._encrypt_block(FIPS_PT, rk), FIPS_CT)
+        self.assertEqual(cipher._decrypt_block(FIPS_CT, cipher._dec_key_schedule(rk)), FIPS_PT)
+
+    def test_python_specialized(self):
+        rk = tuple(cipher._key_expansion(FIPS_KEY))
+        dk = tuple(cipher._dec_key_schedule(rk))
+        self.assertEqual(cipher._specialized_block(rk)(FIPS_PT), FIPS_CT)
+        self.assertEqual(cipher._specialized_block(dk, inverse=True)(FIPS_CT), FIPS_PT)
+
+    @unittest.skipIf(cipher._NATIVE is None, "no native AES extension")
+    def test_native(self):
+        native = cipher._NATIVE
+        sched = native.expand_key(FIPS_KEY)
+        self.assertEqual(sched[-16:], FIPS_LAST_ROUND_KEY)
+        out = bytearray(16)
+        native.aes128_ecb_encrypt(sched, FIPS_PT, out)
+        self.assertEqual(out, FIPS_CT)
+        native.aes128_ecb_decrypt(sched, FIPS_CT, out)
+        self.assertEqual(out, FIPS_PT)
+
+    @unittest.skipIf(JIT is None, "numba not installed")
+    def test_numba(self):
+        rk = tuple(cipher._key_expansion(FIPS_KEY))
+        dk = tuple(cipher._dec_key_schedule(rk))
+        self.assertEqual(JIT.ecb(FIPS_PT, rk, inverse=False), FIPS_CT)
+        self.assertEqual(JIT.ecb(FIPS_CT, dk, inverse=True), FIPS_PT)
+
+
+class RoundTripTest(unittest.TestCase):
+    # 0..33 covers empty input, partial tails and exact multiples; the long input
+    # crosses the pure-Python specialization threshold and the native GIL release size.
+    LENGTHS = list(range(34)) + [16 * cipher._SPECIALIZE_MIN_BLOCKS + 5]
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(1234)
+        cls.messages = [bytes(rng.getrandbits(8) for _ in range(n)) for n in cls.LENGTHS]
+        # Reference ciphertexts from the pure-Python implementation.
+        with use_backend(None, False):
+            cls.expected = {
+                mode: [cipher.encrypt(m, KEY, mode, IV)[0] for m in cls.messages] for mode in ("ecb", "cfb")
+            }
+
+    def test_round_trip(self):
+        for name, native, use_jit in available_backends():
+            for mode in ("ecb", "cfb"):
+                for msg, expected in zip(self.messages, self.expected[mode]):
+                    with self.subTest(backend=name, mode=mode, length=len(msg)), use_backend(native, use_jit):
+                        cipher_hex, iv_hex = cipher.encrypt(msg, KEY, mode, IV)
+                        self.assertEqual(cipher_hex, expected)
+                        self.assertEqual(cipher.decrypt_bytes(cipher_hex, KEY, mode, iv_hex), msg)
+
+    def test_text_round_trip(self):
+        text = "Xin chào AES-128 ✓"
+        for name, native, use_jit in available_backends():
+            for mode in ("ecb", "cfb"):
+                with self.subTest(backend=name, mode=mode), use_backend(native, use_jit):
+                    cipher_hex, iv_hex = cipher.encrypt(text, KEY, mode)
+                    self.assertEqual(cipher.decrypt(cipher_hex, KEY, mode, iv_hex), text)
+
+    def test_bad_padding_rejected(self):
+        for name, native, use_jit in available_backends():
+            with self.subTest(backend=name), use_backend(native, use_jit):
+                # The first block alone decrypts to 16 zero bytes, which is not valid padding.
+                forged = cipher.encrypt(bytes(16), KEY, "ecb")[0][:32]
+                with self.assertRaisesRegex(ValueError, "Invalid padding"):
+                    cipher.decrypt_bytes(forged, KEY, "ecb")
+
+
+class FixtureTest(unittest.TestCase):
+    """The sample files saved by the CLI still round-trip on every backend."""
+
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def read(self, name):
+        with open(os.path.join(self.ROOT, name), encoding="utf-8") as f:
+            return _strip_saved_header(f.read())
+
+    def test_fixtures(self):
+        for mode in ("ecb", "cfb"):
+            plaintext = self.read(f"output-plaintext-aes-{mode}.txt")
+            ciphertext = self.read(f"output-cipher-aes-{mode}.txt").strip()
+            iv = IV if mode == "cfb" else None
+            for name, native, use_jit in available_backends():
+                with self.subTest(backend=name, mode=mode), use_backend(native, use_jit):
+                    self.assertEqual(cipher.decrypt(ciphertext, KEY, mode, iv), plaintext)
+                    self.assertEqual(cipher.encrypt(plaintext, KEY, mode, iv)[0], ciphertext)
+
+
+if __name__ == "__main__":
+    unittest.main()
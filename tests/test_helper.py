@@ -0,0 +1,99 @@
+"""Padding, hex and key/IV helpers, including the native fast paths that must agree with them."""
+
+import random
+import unittest
+
+from aes_cipher import helper
+from aes_cipher._native import HEX_SIMD, NATIVE
+
+
+def padded_last_blocks(rng):
+    """Two-block inputs whose last block has valid, corrupted or out-of-range padding."""
+    for pad_len in range(0, 256):
+        for _ in range(4):
+            body = bytearray(rng.getrandbits(8) for _ in range(32))
+            n = min(pad_len, 16)
+            body[32 - n:] = bytes((pad_len,)) * n
+            body[-1] = pad_len
+            yield bytes(body)
+            if 1 < n:
+                body[32 - rng.randrange(1, n)] ^= 1 << rng.randrange(8)
+                yield bytes(body)
+
+
+class Pkcs7Test(unittest.TestCase):
+    def test_pad_unpad_round_trip(self):
+        for n in range(40):
+            data = bytes(range(n))
+            padded = helper.pkcs7_pad(data)
+            self.assertEqual(len(padded) % 16, 0)
+            self.assertEqual(helper.pkcs7_unpad(bytes(padded)), data)
+
+    def test_unpad_rejects(self):
+        for bad in (b"", bytes(15), bytes(16), bytes(15) + b"\x11", b"\x01" * 14 + b"\x03\x03"):
+            with self.subTest(data=bad), self.assertRaises(ValueError):
+                helper.pkcs7_unpad(bad)
+
+    @unittest.skipIf(NATIVE is None, "no native AES extension")
+    def test_native_unpad_len_matches(self):
+        for data in padded_last_blocks(random.Random(7)):
+            try:
+                expected = len(data) - len(helper.pkcs7_unpad(data))
+            except ValueError:
+                expected = 0
+            self.assertEqual(NATIVE.pkcs7_unpad_len(data), expected, data[-16:].hex())
+
+
+class HexTest(unittest.TestCase):
+    LENGTHS = list(range(70)) + [helper._SIMD_HEX_MIN_BYTES + 1, 1000]
+
+    def test_round_trip(self):
+        rng = random.Random(3)
+        for n in self.LENGTHS:
+            data = bytes(rng.getrandbits(8) for _ in range(n))
+            self.assertEqual(helper.hex_encode(data), data.hex())
+            self.assertEqual(helper.hex_decode(data.hex().upper()), data)
+
+    def test_invalid(self):
+        for text in ("0g", "abc", "zz" * 600):
+            with self.subTest(text=text[:8]), self.assertRaises(ValueError):
+                helper.hex_decode(text)
+
+    @unittest.skipIf(HEX_SIMD is None, "no SIMD hex codec")
+    def test_simd_matches(self):
+        rng = random.Random(5)
+        for n in self.LENGTHS:
+            data = bytes(rng.getrandbits(8) for _ in range(n))
+            self.assertEqual(HEX_SIMD.hex_encode_simd(data), data.hex())
+            self.assertEqual(HEX_SIMD.hex_decode_simd(data.hex()), data)
+            self.assertEqual(HEX_SIMD.hex_decode_simd(data.hex().upper()), data)
+            if n:
+                # A non-hex character anywhere, in the SIMD body or the scalar tail, is refused.
+                text = bytearray(data.hex(), "ascii")
+                text[rng.randrange(len(text))] = ord("g")
+                self.assertIsNone(HEX_SIMD.hex_decode_simd(text.decode()))
+        self.assertIsNone(HEX_SIMD.hex_decode_simd("abc"))
+        self.assertIsNone(HEX_SIMD.hex_decode_simd("ab cd"))
+
+
+class NormalizeTest(unittest.TestCase):
+    def test_key_forms(self):
+        key = bytes(range(16))
+        self.assertEqual(helper.normalize_aes_key(key.hex()), key)
+        self.assertEqual(helper.normalize_aes_key(" " + key.hex().upper() + "\n"), key)
+        self.assertEqual(helper.normalize_aes_key("qtungdeptraivcll"), b"qtungdeptraivcll")
+
+    def test_key_rejected(self):
+        for bad in ("", "short", "g" * 32, "0" * 31 + "x", "ấ" * 16, "0" * 30):
+            with self.subTest(key=bad), self.assertRaises(ValueError):
+                helper.normalize_aes_key(bad)
+
+    def test_iv(self):
+        self.assertEqual(helper.normalize_iv("0011223344556677", 8), bytes.fromhex("0011223344556677"))
+        self.assertEqual(helper.normalize_iv("abcdefgh12345678"), b"abcdefgh12345678")
+        with self.assertRaises(ValueError):
+            helper.normalize_iv("abc")
+
+
+if __name__ == "__main__":
+    unittest.main()